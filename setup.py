@@ -10,8 +10,10 @@ setup(
     author="Your Name",
     packages=find_packages(),
     install_requires=[
-        "pandas>=2.0.0",
+        "pandas>=2.2.0",
         "numpy>=1.24.0",
+        "pyarrow>=14.0.0",
+        "orjson>=3.9.0",
         "matplotlib>=3.7.0",
         "seaborn>=0.12.0",
         "plotly>=5.14.0",
@@ -22,7 +24,7 @@ setup(
         "ipykernel>=6.25.0",
         "notebook>=7.0.0",
         "openpyxl>=3.1.0",
-        "xlrd>=2.0.0",
+        "python-calamine>=0.2.0",
         "python-dotenv>=1.0.0",
         "tqdm>=4.65.0",
     ],
@@ -1,20 +1,46 @@
 """
 Utility modules for data analysis.
 """
+import importlib
+
 from .data_loader import load_data, get_data_path, save_processed_data
-from .visualization import save_figure, plot_distribution, plot_correlation_matrix, plot_time_series, plot_attrition_by_category
-from .report_generator import generate_summary_report, generate_insights_json
+from .report_generator import generate_summary_report, generate_insights_json, generate_reports
+
+# Plotting helpers are imported on first use so that importing the package
+# does not pull in matplotlib and seaborn
+_LAZY = {
+    'save_figure': 'visualization',
+    'save_figures': 'visualization',
+    'plot_distribution': 'visualization',
+    'plot_correlation_matrix': 'visualization',
+    'plot_time_series': 'visualization',
+    'plot_attrition_by_category': 'visualization',
+}
 
 __all__ = [
     'load_data',
     'get_data_path',
     'save_processed_data',
     'save_figure',
+    'save_figures',
     'plot_distribution',
     'plot_correlation_matrix',
     'plot_time_series',
     'plot_attrition_by_category',
     'generate_summary_report',
-    'generate_insights_json'
+    'generate_insights_json',
+    'generate_reports'
 ]
 
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{_LAZY[name]}', __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,70 @@
+"""
+Shared statistics for the summary and JSON reports.
+"""
+import pandas as pd
+
+
+# Metrics and factors reported in the insights JSON
+INSIGHT_METRICS = ['Age', 'MonthlyIncome', 'YearsAtCompany', 'JobSatisfaction',
+                   'WorkLifeBalance', 'StressRating']
+INSIGHT_FACTORS = ['Department', 'Gender', 'MaritalStatus', 'OverTime']
+
+# Metrics and factors reported in the summary report (a superset of the above)
+KEY_METRICS = INSIGHT_METRICS + ['PerformanceIndex']
+FACTORS = INSIGHT_FACTORS + ['BusinessTravel']
+
+
+def compute_stats(df):
+    """
+    Compute the statistics used by the report generators.
+    
+    Pass the result to generate_summary_report and generate_insights_json
+    (or use generate_reports) to compute the statistics only once when
+    writing both reports.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Input dataframe
+    
+    Returns:
+    --------
+    dict
+        'attrition_counts' : pd.Series or None
+            Non-zero counts of each Attrition value
+        'metric_stats' : pd.DataFrame or None
+            mean, median, std, min and max (rows) of each numeric key metric (columns)
+        'attrition_by_factor' : dict of pd.Series
+            Attrition rate (%) for each value of each factor
+        'income_by_attrition' : pd.Series or None
+            Mean MonthlyIncome for each Attrition value
+    """
+    stats = {
+        'attrition_counts': None,
+        'metric_stats': None,
+        'attrition_by_factor': {},
+        'income_by_attrition': None
+    }
+    
+    present_metrics = [m for m in KEY_METRICS
+                       if m in df.columns and pd.api.types.is_numeric_dtype(df[m])]
+    if present_metrics:
+        stats['metric_stats'] = df[present_metrics].agg(['mean', 'median', 'std', 'min', 'max'])
+    
+    if 'Attrition' in df.columns:
+        attrition_counts = df['Attrition'].value_counts()
+        stats['attrition_counts'] = attrition_counts[attrition_counts > 0]
+    
+        is_yes = df['Attrition'].eq('Yes')
+        for factor in FACTORS:
+            if factor in df.columns:
+                stats['attrition_by_factor'][factor] = (
+                    is_yes.groupby(df[factor], observed=True).mean() * 100
+                )
+    
+        if 'MonthlyIncome' in df.columns:
+            stats['income_by_attrition'] = (
+                df.groupby('Attrition', observed=True)['MonthlyIncome'].mean()
+            )
+    
+    return stats
@@ -4,10 +4,45 @@ Utility functions for loading and preprocessing data.
 import pandas as pd
 import numpy as np
 from pathlib import Path
+import hashlib
 import os
+import tempfile
+import time
 
+try:
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
-def load_data(file_path, file_type=None):
+try:
+    import python_calamine  # noqa: F401
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+
+
+# Columns used by the report and visualization utilities
+DEFAULT_COLUMNS = [
+    'Attrition', 'Age', 'MonthlyIncome', 'YearsAtCompany', 'JobSatisfaction',
+    'WorkLifeBalance', 'StressRating', 'PerformanceIndex', 'Department',
+    'JobRole', 'Gender', 'MaritalStatus', 'OverTime', 'BusinessTravel'
+]
+
+# CSV files larger than this are parsed in parallel blocks by pyarrow
+LARGE_CSV_BYTES = 200 * 1024 * 1024
+CSV_BLOCK_SIZE = 64 << 20
+
+# Narrowest integer dtype used when downcasting loaded columns
+MIN_INTEGER_DTYPE = np.dtype('int32')
+
+# Columns always stored as category dtype for faster groupby
+CATEGORY_COLUMNS = [
+    'Department', 'Gender', 'MaritalStatus', 'OverTime', 'BusinessTravel', 'JobRole'
+]
+
+
+def load_data(file_path, file_type=None, columns=None, use_arrow=True):
     """
     Load data from various file formats.
     
@@ -18,6 +53,21 @@ def load_data(file_path, file_type=None):
     file_type : str, optional
         Type of file ('csv', 'excel', 'json', 'parquet')
         If None, will infer from file extension
+    columns : list of str, optional
+        Subset of columns to read (e.g. DEFAULT_COLUMNS). If None, reads all columns
+    use_arrow : bool
+        Use the PyArrow engine for CSV and Parquet files when available
+    
+    Integer columns are downcast to int32 where their values fit, and float
+    columns to float32 only where every value converts exactly. Low-cardinality text columns (including Attrition) are
+    converted to category, so they are matched by
+    select_dtypes(include='category') rather than 'object', and methods such
+    as Series.map return categorical results.
+    Loaded frames are cached as Feather files in data/.cache, keyed on the
+    file path, modification time, size and reader options. Entries for older
+    versions of a file are removed when it is cached again, and the cache
+    keeps at most CACHE_MAX_ENTRIES files. Set the BA_DISABLE_CACHE
+    environment variable to bypass the cache.
     
     Returns:
     --------
@@ -29,6 +79,13 @@ def load_data(file_path, file_type=None):
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
     
+    # Prefer an up-to-date Parquet copy of a CSV file if one exists
+    if file_type is None and file_path.suffix.lower() == '.csv':
+        parquet_path = file_path.with_suffix('.parquet')
+        if (parquet_path.exists()
+                and parquet_path.stat().st_mtime >= file_path.stat().st_mtime):
+            file_path = parquet_path
+    
     # Infer file type from extension if not provided
     if file_type is None:
         ext = file_path.suffix.lower()
@@ -43,24 +100,189 @@ def load_data(file_path, file_type=None):
         else:
             raise ValueError(f"Unsupported file type: {ext}")
     
-    # Load based on file type
+    use_cache = HAS_PYARROW and not os.environ.get('BA_DISABLE_CACHE')
+    if use_cache:
+        cache_path = _get_cache_path(file_path, file_type, columns, use_arrow)
+        if cache_path.exists():
+            try:
+                return pd.read_feather(cache_path, use_threads=True)
+            except Exception:
+                # Unreadable entry (e.g. truncated); drop it and read the file
+                cache_path.unlink(missing_ok=True)
+    
+    df = _optimize_dtypes(_read_file(file_path, file_type, columns, use_arrow))
+    
+    if use_cache and _write_cache(df, cache_path):
+        try:
+            _prune_cache(cache_path)
+        except Exception:
+            pass
+    
+    return df
+
+
+def _read_file(file_path, file_type, columns, use_arrow):
+    """Read a data file with the reader matching its file type."""
     if file_type == 'csv':
-        return pd.read_csv(file_path)
+        if use_arrow and HAS_PYARROW:
+            if file_path.stat().st_size > LARGE_CSV_BYTES:
+                return _read_large_csv(file_path, columns)
+            return pd.read_csv(file_path, engine='pyarrow', usecols=columns)
+        return pd.read_csv(file_path, usecols=columns)
     elif file_type == 'excel':
-        return pd.read_excel(file_path)
+        if HAS_CALAMINE:
+            return pd.read_excel(file_path, engine='calamine', usecols=columns)
+        return pd.read_excel(file_path, usecols=columns)
     elif file_type == 'json':
-        return pd.read_json(file_path)
+        df = pd.read_json(file_path)
+        return df[columns] if columns is not None else df
     elif file_type == 'parquet':
-        return pd.read_parquet(file_path)
+        engine = 'pyarrow' if use_arrow and HAS_PYARROW else 'auto'
+        return pd.read_parquet(file_path, engine=engine, columns=columns)
     else:
         raise ValueError(f"Unsupported file type: {file_type}")
 
 
+def _read_large_csv(file_path, columns=None):
+    """Read a large CSV file with pyarrow's multithreaded block reader."""
+    read_options = pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE, use_threads=True)
+    convert_options = pa_csv.ConvertOptions(include_columns=columns)
+    table = pa_csv.read_csv(file_path, read_options=read_options,
+                            convert_options=convert_options)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _optimize_dtypes(df, max_category_ratio=0.5):
+    """
+    Downcast numeric columns and convert low-cardinality text columns to category.
+    
+    Integers are never narrowed below MIN_INTEGER_DTYPE, so ordinary
+    arithmetic such as MonthlyIncome * 12 or Age * Age does not wrap around.
+    Floats are only converted to float32 when the round trip is exact, so
+    values are never rounded.
+    Nullable and Arrow-backed numeric columns are left unchanged.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        DataFrame to optimize
+    max_category_ratio : float
+        Maximum ratio of unique values to rows for a text column to become categorical
+    
+    Returns:
+    --------
+    pd.DataFrame
+        DataFrame with smaller dtypes
+    """
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series):
+            continue
+        if pd.api.types.is_integer_dtype(series):
+            if (isinstance(series.dtype, np.dtype)
+                    and series.dtype.itemsize > MIN_INTEGER_DTYPE.itemsize):
+                info = np.iinfo(MIN_INTEGER_DTYPE)
+                if series.empty or (series.min() >= info.min and series.max() <= info.max):
+                    df[col] = series.astype(MIN_INTEGER_DTYPE)
+        elif pd.api.types.is_float_dtype(series):
+            if (isinstance(series.dtype, np.dtype)
+                    and series.dtype.itemsize > np.dtype('float32').itemsize):
+                # Values beyond the float32 range overflow to inf and fail the check
+                with np.errstate(over='ignore'):
+                    downcast = series.astype('float32')
+                round_trip = downcast.astype(series.dtype)
+                if ((round_trip == series) | (round_trip.isna() & series.isna())).all():
+                    df[col] = downcast
+        elif series.dtype == object or isinstance(series.dtype, pd.StringDtype):
+            if col in CATEGORY_COLUMNS or (
+                    len(df) and series.nunique() / len(df) < max_category_ratio):
+                df[col] = series.astype('category')
+    return df
+
+
 def get_project_root():
     """Get the project root directory."""
     return Path(__file__).parent.parent.parent
 
 
+_cache_dir = get_project_root() / 'data' / '.cache'
+CACHE_MAX_ENTRIES = 32
+STALE_TMP_SECONDS = 60 * 60
+# Bump when the cached frame layout changes (e.g. dtype handling in load_data)
+_CACHE_VERSION = 3
+
+
+def _hash_key(text):
+    return hashlib.blake2b(text.encode()).hexdigest()[:16]
+
+
+def _get_cache_path(file_path, file_type, columns=None, use_arrow=True):
+    """
+    Get the Feather cache path for a data file and reader options.
+    
+    Cache files are named '<path key>-<version key>-<options key>.feather' so
+    that entries for older versions of the same file can be found and removed.
+    """
+    stat = file_path.stat()
+    path_key = _hash_key(str(file_path.resolve()))
+    version_key = _hash_key(f"{stat.st_mtime_ns}:{stat.st_size}")
+    columns_key = ','.join(columns) if columns is not None else '*'
+    options_key = _hash_key(f"{_CACHE_VERSION}:{file_type}:{use_arrow}:{columns_key}")
+    return _cache_dir / f"{path_key}-{version_key}-{options_key}.feather"
+
+
+def _write_cache(df, cache_path):
+    """
+    Write a cache entry atomically, returning whether it was written.
+    
+    The frame is written to a temporary file in the cache directory and then
+    moved into place, so an interrupted write or a concurrent reader never
+    sees a partial entry.
+    """
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        df.to_feather(tmp_path, compression='lz4')
+        os.replace(tmp_path, cache_path)
+        return True
+    except Exception:
+        # Caching is best-effort; never fail a load because of it
+        return False
+    finally:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+
+def _prune_cache(cache_path):
+    """Remove stale cache entries for the same file and cap the cache size."""
+    path_key, version_key, _ = cache_path.stem.split('-')
+    for entry in cache_path.parent.glob(f"{path_key}-*.feather"):
+        if not entry.stem.startswith(f"{path_key}-{version_key}-"):
+            entry.unlink(missing_ok=True)
+    
+    # Entries may be removed by another process while we look at them
+    entries = []
+    for entry in cache_path.parent.glob('*.feather'):
+        try:
+            entries.append((entry.stat().st_mtime, entry))
+        except FileNotFoundError:
+            continue
+    entries.sort(key=lambda item: item[0], reverse=True)
+    for _, entry in entries[CACHE_MAX_ENTRIES:]:
+        entry.unlink(missing_ok=True)
+    
+    # Temporary files left behind by killed processes
+    for tmp in cache_path.parent.glob('*.tmp'):
+        try:
+            if time.time() - tmp.stat().st_mtime > STALE_TMP_SECONDS:
+                tmp.unlink(missing_ok=True)
+        except FileNotFoundError:
+            continue
+
+
 def get_data_path(file_name=None, subfolder='raw'):
     """
     Get path to data directory or specific data file.
@@ -97,6 +319,8 @@ def save_processed_data(df, file_name, subfolder='processed'):
         Name of the output file
     subfolder : str
         Subfolder in data directory ('processed')
+    
+    Files without a recognised extension are saved as Snappy-compressed Parquet.
     """
     output_path = get_data_path(file_name, subfolder)
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -107,11 +331,11 @@ def save_processed_data(df, file_name, subfolder='processed'):
     elif ext in ['.xlsx', '.xls']:
         df.to_excel(output_path, index=False)
     elif ext == '.parquet':
-        df.to_parquet(output_path, index=False)
+        df.to_parquet(output_path, index=False, engine='pyarrow', compression='snappy')
     else:
-        # Default to CSV
-        output_path = output_path.with_suffix('.csv')
-        df.to_csv(output_path, index=False)
+        # Default to Parquet
+        output_path = output_path.with_suffix('.parquet')
+        df.to_parquet(output_path, index=False, engine='pyarrow', compression='snappy')
     
     print(f"Data saved to: {output_path}")
 
@@ -5,10 +5,12 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
-import json
+import orjson
 
+from ._stats import compute_stats, KEY_METRICS, FACTORS, INSIGHT_METRICS, INSIGHT_FACTORS
 
-def generate_summary_report(df, output_path=None):
+
+def generate_summary_report(df, output_path=None, stats=None):
     """
     Generate a comprehensive summary report of the analysis.
     
@@ -18,6 +20,8 @@ def generate_summary_report(df, output_path=None):
         Input dataframe
     output_path : str or Path, optional
         Path to save the report. If None, saves to outputs/reports/
+    stats : dict, optional
+        Precomputed statistics for df from compute_stats. If None, computed here
     """
     if output_path is None:
         output_dir = Path(__file__).parent.parent.parent / 'outputs' / 'reports'
@@ -28,106 +32,107 @@ def generate_summary_report(df, output_path=None):
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    report_lines = []
-    report_lines.append("=" * 80)
-    report_lines.append("EMPLOYEE ATTRITION ANALYSIS - SUMMARY REPORT")
-    report_lines.append("=" * 80)
-    report_lines.append(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report_lines.append("")
-    
-    # Dataset Overview
-    report_lines.append("DATASET OVERVIEW")
-    report_lines.append("-" * 80)
-    report_lines.append(f"Total Employees: {len(df):,}")
-    report_lines.append(f"Total Features: {len(df.columns)}")
-    report_lines.append("")
+    if stats is None:
+        stats = compute_stats(df)
     
-    # Attrition Overview
-    if 'Attrition' in df.columns:
-        attrition_counts = df['Attrition'].value_counts()
-        attrition_pct = df['Attrition'].value_counts(normalize=True) * 100
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        def write_line(line=""):
+            f.write(line)
+            f.write("\n")
         
-        report_lines.append("ATTRITION OVERVIEW")
-        report_lines.append("-" * 80)
-        for val, count in attrition_counts.items():
-            report_lines.append(f"  {val}: {count:,} ({attrition_pct[val]:.2f}%)")
-        report_lines.append("")
-    
-    # Key Statistics
-    report_lines.append("KEY STATISTICS")
-    report_lines.append("-" * 80)
-    
-    key_metrics = ['Age', 'MonthlyIncome', 'YearsAtCompany', 'JobSatisfaction', 
-                   'WorkLifeBalance', 'StressRating', 'PerformanceIndex']
-    
-    for metric in key_metrics:
-        if metric in df.columns:
-            if df[metric].dtype in [np.int64, np.float64]:
-                report_lines.append(f"\n{metric}:")
-                report_lines.append(f"  Mean: {df[metric].mean():.2f}")
-                report_lines.append(f"  Median: {df[metric].median():.2f}")
-                report_lines.append(f"  Std Dev: {df[metric].std():.2f}")
-                report_lines.append(f"  Min: {df[metric].min():.2f}")
-                report_lines.append(f"  Max: {df[metric].max():.2f}")
-    
-    # Department Distribution
-    if 'Department' in df.columns:
-        report_lines.append("\nDEPARTMENT DISTRIBUTION")
-        report_lines.append("-" * 80)
-        dept_counts = df['Department'].value_counts()
-        for dept, count in dept_counts.items():
-            pct = (count / len(df)) * 100
-            report_lines.append(f"  {dept}: {count:,} ({pct:.2f}%)")
-    
-    # Job Role Distribution
-    if 'JobRole' in df.columns:
-        report_lines.append("\nTOP 10 JOB ROLES")
-        report_lines.append("-" * 80)
-        job_counts = df['JobRole'].value_counts().head(10)
-        for job, count in job_counts.items():
-            pct = (count / len(df)) * 100
-            report_lines.append(f"  {job}: {count:,} ({pct:.2f}%)")
-    
-    # Attrition by Key Factors
-    if 'Attrition' in df.columns:
-        report_lines.append("\nATTRITION RATES BY KEY FACTORS")
-        report_lines.append("-" * 80)
+        write_line("=" * 80)
+        write_line("EMPLOYEE ATTRITION ANALYSIS - SUMMARY REPORT")
+        write_line("=" * 80)
+        write_line(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        write_line("")
         
-        factors = ['Department', 'Gender', 'MaritalStatus', 'OverTime', 'BusinessTravel']
-        for factor in factors:
-            if factor in df.columns:
-                factor_attrition = df.groupby(factor)['Attrition'].apply(
-                    lambda x: (x == 'Yes').sum() / len(x) * 100
-                ).sort_values(ascending=False)
-                
-                report_lines.append(f"\n{factor}:")
-                for val, rate in factor_attrition.items():
-                    report_lines.append(f"  {val}: {rate:.2f}%")
-    
-    # Income Analysis
-    if 'MonthlyIncome' in df.columns and 'Attrition' in df.columns:
-        report_lines.append("\nINCOME ANALYSIS")
-        report_lines.append("-" * 80)
-        income_yes = df[df['Attrition'] == 'Yes']['MonthlyIncome'].mean()
-        income_no = df[df['Attrition'] == 'No']['MonthlyIncome'].mean()
-        report_lines.append(f"Average Monthly Income (Left): ${income_yes:,.2f}")
-        report_lines.append(f"Average Monthly Income (Stayed): ${income_no:,.2f}")
-        report_lines.append(f"Income Difference: ${income_no - income_yes:,.2f}")
-    
-    report_lines.append("\n" + "=" * 80)
-    report_lines.append("END OF REPORT")
-    report_lines.append("=" * 80)
-    
-    # Write report to file
-    report_text = "\n".join(report_lines)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(report_text)
+        # Dataset Overview
+        write_line("DATASET OVERVIEW")
+        write_line("-" * 80)
+        write_line(f"Total Employees: {len(df):,}")
+        write_line(f"Total Features: {len(df.columns)}")
+        write_line("")
+        
+        # Attrition Overview
+        if stats['attrition_counts'] is not None:
+            attrition_counts = stats['attrition_counts']
+            attrition_pct = attrition_counts / attrition_counts.sum() * 100
+        
+            write_line("ATTRITION OVERVIEW")
+            write_line("-" * 80)
+            for val, count in attrition_counts.items():
+                write_line(f"  {val}: {count:,} ({attrition_pct[val]:.2f}%)")
+            write_line("")
+        
+        # Key Statistics
+        write_line("KEY STATISTICS")
+        write_line("-" * 80)
+        
+        metric_stats = stats['metric_stats']
+        if metric_stats is not None:
+            for metric in KEY_METRICS:
+                if metric in metric_stats.columns:
+                    write_line(f"\n{metric}:")
+                    write_line(f"  Mean: {metric_stats.at['mean', metric]:.2f}")
+                    write_line(f"  Median: {metric_stats.at['median', metric]:.2f}")
+                    write_line(f"  Std Dev: {metric_stats.at['std', metric]:.2f}")
+                    write_line(f"  Min: {metric_stats.at['min', metric]:.2f}")
+                    write_line(f"  Max: {metric_stats.at['max', metric]:.2f}")
+        
+        # Department Distribution
+        if 'Department' in df.columns:
+            write_line("\nDEPARTMENT DISTRIBUTION")
+            write_line("-" * 80)
+            dept_counts = df['Department'].value_counts()
+            dept_counts = dept_counts[dept_counts > 0]
+            dept_pct = dept_counts / len(df) * 100
+            for dept, count in dept_counts.items():
+                write_line(f"  {dept}: {count:,} ({dept_pct[dept]:.2f}%)")
+        
+        # Job Role Distribution
+        if 'JobRole' in df.columns:
+            write_line("\nTOP 10 JOB ROLES")
+            write_line("-" * 80)
+            job_counts = df['JobRole'].value_counts().head(10)
+            job_counts = job_counts[job_counts > 0]
+            job_pct = job_counts / len(df) * 100
+            for job, count in job_counts.items():
+                write_line(f"  {job}: {count:,} ({job_pct[job]:.2f}%)")
+        
+        # Attrition by Key Factors
+        if 'Attrition' in df.columns:
+            write_line("\nATTRITION RATES BY KEY FACTORS")
+            write_line("-" * 80)
+        
+            for factor in FACTORS:
+                if factor in stats['attrition_by_factor']:
+                    factor_attrition = stats['attrition_by_factor'][factor].sort_values(
+                        ascending=False)
+        
+                    write_line(f"\n{factor}:")
+                    for val, rate in factor_attrition.items():
+                        write_line(f"  {val}: {rate:.2f}%")
+        
+        # Income Analysis
+        if stats['income_by_attrition'] is not None:
+            write_line("\nINCOME ANALYSIS")
+            write_line("-" * 80)
+            income_means = stats['income_by_attrition']
+            income_yes = income_means.get('Yes', np.nan)
+            income_no = income_means.get('No', np.nan)
+            write_line(f"Average Monthly Income (Left): ${income_yes:,.2f}")
+            write_line(f"Average Monthly Income (Stayed): ${income_no:,.2f}")
+            write_line(f"Income Difference: ${income_no - income_yes:,.2f}")
+        
+        write_line("\n" + "=" * 80)
+        write_line("END OF REPORT")
+        write_line("=" * 80)
     
     print(f"Summary report saved to: {output_path}")
     return output_path
 
 
-def generate_insights_json(df, output_path=None):
+def generate_insights_json(df, output_path=None, stats=None):
     """
     Generate insights as JSON file.
     
@@ -137,6 +142,8 @@ def generate_insights_json(df, output_path=None):
         Input dataframe
     output_path : str or Path, optional
         Path to save the JSON file
+    stats : dict, optional
+        Precomputed statistics for df from compute_stats. If None, computed here
     """
     if output_path is None:
         output_dir = Path(__file__).parent.parent.parent / 'outputs' / 'reports'
@@ -147,47 +154,77 @@ def generate_insights_json(df, output_path=None):
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
     
+    if stats is None:
+        stats = compute_stats(df)
     insights = {
         'generated_at': datetime.now().isoformat(),
         'dataset_info': {
-            'total_employees': int(len(df)),
-            'total_features': int(len(df.columns))
+            'total_employees': len(df),
+            'total_features': len(df.columns)
         }
     }
     
-    if 'Attrition' in df.columns:
+    if stats['attrition_counts'] is not None:
+        attrition_counts = stats['attrition_counts']
         insights['attrition'] = {
-            'overall_rate': float((df['Attrition'] == 'Yes').sum() / len(df) * 100),
-            'counts': df['Attrition'].value_counts().to_dict()
+            'overall_rate': attrition_counts.get('Yes', 0) / len(df) * 100,
+            'counts': attrition_counts.to_dict()
         }
     
     # Key metrics
-    key_metrics = ['Age', 'MonthlyIncome', 'YearsAtCompany', 'JobSatisfaction', 
-                   'WorkLifeBalance', 'StressRating']
     insights['key_metrics'] = {}
-    for metric in key_metrics:
-        if metric in df.columns:
-            insights['key_metrics'][metric] = {
-                'mean': float(df[metric].mean()),
-                'median': float(df[metric].median()),
-                'std': float(df[metric].std())
-            }
+    metric_stats = stats['metric_stats']
+    if metric_stats is not None:
+        for metric in INSIGHT_METRICS:
+            if metric in metric_stats.columns:
+                insights['key_metrics'][metric] = {
+                    'mean': metric_stats.at['mean', metric],
+                    'median': metric_stats.at['median', metric],
+                    'std': metric_stats.at['std', metric]
+                }
     
     # Attrition by factors
     if 'Attrition' in df.columns:
         insights['attrition_by_factors'] = {}
-        factors = ['Department', 'Gender', 'MaritalStatus', 'OverTime']
-        for factor in factors:
-            if factor in df.columns:
-                factor_attrition = df.groupby(factor)['Attrition'].apply(
-                    lambda x: (x == 'Yes').sum() / len(x) * 100
-                ).to_dict()
+        for factor in INSIGHT_FACTORS:
+            if factor in stats['attrition_by_factor']:
+                factor_attrition = stats['attrition_by_factor'][factor].to_dict()
                 insights['attrition_by_factors'][factor] = factor_attrition
     
     # Save JSON
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(insights, f, indent=2, ensure_ascii=False)
+    output_path.write_bytes(orjson.dumps(
+        insights,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ))
     
     print(f"Insights JSON saved to: {output_path}")
     return output_path
 
+
+def generate_reports(df, output_dir=None):
+    """
+    Generate both the summary report and the insights JSON.
+    
+    Statistics are computed once and shared by both reports.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Input dataframe
+    output_dir : str or Path, optional
+        Directory to save the reports in. If None, saves to outputs/reports/
+    
+    Returns:
+    --------
+    tuple of Path
+        Paths of the summary report and the insights JSON
+    """
+    report_path = insights_path = None
+    if output_dir is not None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        report_path = Path(output_dir) / f'summary_report_{timestamp}.txt'
+        insights_path = Path(output_dir) / f'insights_{timestamp}.json'
+    
+    stats = compute_stats(df)
+    return (generate_summary_report(df, report_path, stats=stats),
+            generate_insights_json(df, insights_path, stats=stats))